@@ -66,14 +66,11 @@ def duplication_complementation_graph(n: count_t, deletion_proba: float, interac
 
     while graph.number_of_nodes() < n:
         new_node = graph.number_of_nodes()
-        # Choose a random node from the current graph to duplicate. We may need to sample multiple
-        # times if one of the nodes was deleted due to being disconnected. This may be costly if the
-        # deletion probability is high and the interaction probability is low.
+        # Choose a random node from the current graph to duplicate. Nodes are never removed and the
+        # new node only exists if it has at least one edge, so node labels remain consecutive and a
+        # single draw always yields an existing node.
         random_node_dist = uniform_int_distribution[node_t](0, new_node - 1)
-        while True:
-            seed_node = random_node_dist(random_engine_instance)
-            if graph.has_node(seed_node):
-                break
+        seed_node = random_node_dist(random_engine_instance)
         IF DEBUG_LOGGING:
             LOGGER.info("selected seed %d for new node %d", seed_node, new_node)
 
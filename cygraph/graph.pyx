@@ -296,6 +296,107 @@ cdef class Graph:
             num_edges += item.second.size()
         return num_edges // 2
 
+    def has_edges(self, pairs):
+        """
+        Returns whether each of multiple edges exists.
+
+        Args:
+            pairs: Array of node pairs with shape `(n, 2)`.
+
+        Returns:
+            exists: Boolean array with shape `(n,)` indicating whether each edge exists.
+
+        Raises:
+            ValueError: If `pairs` does not have shape `(n, 2)`.
+        """
+        import numpy as np
+        pairs = np.asarray(pairs, dtype="l")
+        # An empty list has shape (0,), so we treat it as an empty array of pairs.
+        if pairs.ndim == 1 and pairs.size == 0:
+            pairs = pairs.reshape((0, 2))
+        if pairs.ndim != 2 or pairs.shape[1] != 2:
+            raise ValueError(f"pairs must have shape (n, 2) but got {pairs.shape}")
+        cdef const node_t[:, :] pairs_view = pairs
+        exists = np.empty(pairs_view.shape[0], dtype=np.uint8)
+        cdef unsigned char[::1] exists_view = exists
+        cdef Py_ssize_t i
+        for i in range(pairs_view.shape[0]):
+            exists_view[i] = self.has_edge(pairs_view[i, 0], pairs_view[i, 1])
+        return exists.view(bool)
+
+    def degrees(self, nodes):
+        """
+        Returns the degree of each of multiple nodes.
+
+        Args:
+            nodes: Array of nodes with shape `(n,)`.
+
+        Returns:
+            degrees: Integer array with shape `(n,)` of node degrees.
+
+        Raises:
+            ValueError: If `nodes` does not have shape `(n,)`.
+            KeyError: If one of the nodes does not exist.
+        """
+        import numpy as np
+        nodes = np.asarray(nodes, dtype="l")
+        if nodes.ndim != 1:
+            raise ValueError(f"nodes must have shape (n,) but got {nodes.shape}")
+        cdef const node_t[:] nodes_view = nodes
+        degrees = np.empty(nodes_view.shape[0], dtype="l")
+        cdef count_t[::1] degrees_view = degrees
+        cdef Py_ssize_t i
+        for i in range(nodes_view.shape[0]):
+            it = self._adjacency_map.find(nodes_view[i])
+            if it == self._adjacency_map.end():
+                raise KeyError(f"node {nodes_view[i]} does not exist")
+            degrees_view[i] = dereference(it).second.size()
+        return degrees
+
+    def neighbors_many(self, nodes):
+        """
+        Returns the neighbors of each of multiple nodes in compressed sparse row format.
+
+        Args:
+            nodes: Array of nodes with shape `(n,)`.
+
+        Returns:
+            indptr: Integer array with shape `(n + 1,)` such that the neighbors of the `i`-th node
+                are `indices[indptr[i]:indptr[i + 1]]`.
+            indices: Integer array of neighbors in arbitrary order for each node.
+
+        Raises:
+            ValueError: If `nodes` does not have shape `(n,)`.
+            KeyError: If one of the nodes does not exist.
+        """
+        import numpy as np
+        nodes = np.asarray(nodes, dtype="l")
+        if nodes.ndim != 1:
+            raise ValueError(f"nodes must have shape (n,) but got {nodes.shape}")
+        cdef const node_t[:] nodes_view = nodes
+        cdef vector_t[node_set_t*] neighbor_sets
+        indptr = np.empty(nodes_view.shape[0] + 1, dtype="l")
+        cdef count_t[::1] indptr_view = indptr
+        cdef Py_ssize_t i
+
+        # Look up neighbor sets once and evaluate offsets before copying neighbors.
+        indptr_view[0] = 0
+        for i in range(nodes_view.shape[0]):
+            it = self._adjacency_map.find(nodes_view[i])
+            if it == self._adjacency_map.end():
+                raise KeyError(f"node {nodes_view[i]} does not exist")
+            neighbor_sets.push_back(&dereference(it).second)
+            indptr_view[i + 1] = indptr_view[i] + dereference(it).second.size()
+
+        indices = np.empty(indptr_view[nodes_view.shape[0]], dtype="l")
+        cdef node_t[::1] indices_view = indices
+        cdef count_t offset = 0
+        for neighbors in neighbor_sets:
+            for neighbor in dereference(neighbors):
+                indices_view[offset] = neighbor
+                offset += 1
+        return indptr, indices
+
     def __contains__(self, node: node_t) -> bool:
         return self.has_node(node)
 
@@ -0,0 +1,9 @@
+from libc.stdint cimport uint64_t
+from .graph cimport count_t, Graph
+
+
+ctypedef uint64_t hash_t
+
+
+cpdef hash_t weisfeiler_lehman_graph_hash(Graph graph, count_t iterations=*) except? 0
+cpdef dict weisfeiler_lehman_node_labels(Graph graph, count_t iterations=*)
@@ -0,0 +1,120 @@
+from libcpp.algorithm cimport sort
+from libcpp.unordered_map cimport unordered_map as unordered_map_t
+from libcpp.vector cimport vector as vector_t
+from .graph cimport count_t, Graph, node_list_t, node_t
+from .util import assert_interval
+
+
+ctypedef vector_t[hash_t] hash_list_t
+
+
+cdef inline hash_t _mix(hash_t x) nogil:
+    # Finalizer of the splitmix64 generator (see https://prng.di.unimi.it/splitmix64.c).
+    x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL
+    x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL
+    return x ^ (x >> 31)
+
+
+cdef inline hash_t _combine(hash_t seed, hash_t value) nogil:
+    # Order-dependent combination of hashes in the spirit of `boost::hash_combine`.
+    return _mix(seed ^ (_mix(value) + 0x9e3779b97f4a7c15ULL + (seed << 6) + (seed >> 2)))
+
+
+cdef hash_t _digest(hash_list_t& labels, hash_list_t& buffer):
+    # Hash the multiset of labels by sorting them first so the digest does not depend on node order.
+    buffer.assign(labels.begin(), labels.end())
+    sort(buffer.begin(), buffer.end())
+    cdef hash_t value = _mix(buffer.size())
+    for label in buffer:
+        value = _combine(value, label)
+    return value
+
+
+cdef hash_t _refine_labels(Graph graph, count_t iterations, node_list_t& nodes,
+                           hash_list_t& labels):
+    """
+    Refine node labels in-place and return the hash of the entire graph.
+    """
+    cdef unordered_map_t[node_t, count_t] index
+    cdef vector_t[count_t] indptr, indices
+    cdef hash_list_t previous, buffer
+    cdef count_t i, j
+    cdef hash_t value, graph_hash
+
+    # Relabel nodes with consecutive indices and build a compressed adjacency representation so we
+    # don't have to do any hash map lookups while refining labels. Iterating over the adjacency map
+    # twice visits nodes in the same order.
+    nodes.clear()
+    for pair in graph._adjacency_map:
+        index[pair.first] = nodes.size()
+        nodes.push_back(pair.first)
+
+    indptr.push_back(0)
+    labels.clear()
+    for pair in graph._adjacency_map:
+        for neighbor in pair.second:
+            indices.push_back(index[neighbor])
+        indptr.push_back(indices.size())
+        # Initial labels are the node degrees.
+        labels.push_back(_mix(pair.second.size()))
+
+    graph_hash = _digest(labels, buffer)
+    for _ in range(iterations):
+        previous.swap(labels)
+        labels.resize(previous.size())
+        for i in range(nodes.size()):
+            # Sort neighbor labels to obtain a canonical representation of the multiset.
+            buffer.clear()
+            for j in range(indptr[i], indptr[i + 1]):
+                buffer.push_back(previous[indices[j]])
+            sort(buffer.begin(), buffer.end())
+            value = _mix(previous[i])
+            for label in buffer:
+                value = _combine(value, label)
+            labels[i] = value
+        graph_hash = _combine(graph_hash, _digest(labels, buffer))
+    return graph_hash
+
+
+cpdef hash_t weisfeiler_lehman_graph_hash(Graph graph, count_t iterations=3) except? 0:
+    """
+    Weisfeiler-Lehman hash of a graph using 64-bit integer hashing. See
+    :func:`networkx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash` for details.
+
+    Args:
+        graph: Graph to hash.
+        iterations: Number of label refinement iterations.
+
+    Returns:
+        hash: Unsigned 64-bit integer hash of the graph.
+
+    Isomorphic graphs have the same hash, and non-isomorphic graphs have different hashes with high
+    probability (with the exception of graphs that cannot be distinguished by the Weisfeiler-Lehman
+    test, such as regular graphs of the same size and degree). Hashes are stable across processes
+    and platforms so they can be used as cache keys. Initial node labels are node degrees.
+    """
+    cdef node_list_t nodes
+    cdef hash_list_t labels
+    assert_interval("iterations", iterations, 0, None)
+    return _refine_labels(graph, iterations, nodes, labels)
+
+
+cpdef dict weisfeiler_lehman_node_labels(Graph graph, count_t iterations=3):
+    """
+    Weisfeiler-Lehman node labels after iterative refinement. See
+    :func:`networkx.algorithms.graph_hashing.weisfeiler_lehman_subgraph_hashes` for details.
+
+    Args:
+        graph: Graph whose nodes to label.
+        iterations: Number of label refinement iterations.
+
+    Returns:
+        labels: Mapping from nodes to unsigned 64-bit integer labels. Nodes with the same label have
+            isomorphic neighborhoods up to depth `iterations` with high probability.
+    """
+    cdef node_list_t nodes
+    cdef hash_list_t labels
+    cdef count_t i
+    assert_interval("iterations", iterations, 0, None)
+    _refine_labels(graph, iterations, nodes, labels)
+    return {nodes[i]: labels[i] for i in range(nodes.size())}
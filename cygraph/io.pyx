@@ -0,0 +1,290 @@
+from libc.limits cimport LONG_MAX
+from libc.stdint cimport int64_t
+from libc.string cimport memmove
+from .graph cimport count_t, Graph, node_t
+from .util import assert_interval
+import contextlib
+import gzip
+
+
+DEF MAX_LINE_LENGTH = 64
+
+
+def _open(path, mode: str):
+    """
+    Open a file, decompressing or compressing it if the filename ends with `.gz`. File-like objects
+    are passed through without closing them when the context exits.
+    """
+    if hasattr(path, "read") or hasattr(path, "write"):
+        return contextlib.nullcontext(path)
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+cdef inline bint _is_space(char c):
+    return c == c' ' or c == c'\t' or c == c'\r'
+
+
+cdef inline bint _is_line_end(char c):
+    return c == c'\n' or c == c'#'
+
+
+cdef count_t _parse_text_edges(Graph graph, const char* data, Py_ssize_t size,
+                               count_t* line_number) except -1:
+    """
+    Parse complete lines of whitespace-separated node pairs and add them to the graph. Returns the
+    number of newly added edges.
+    """
+    cdef Py_ssize_t i = 0, start
+    cdef node_t nodes[2]
+    cdef unsigned long value, limit, digit
+    cdef bint negative
+    cdef int num_nodes
+    cdef count_t num_added = 0
+
+    while i < size:
+        line_number[0] += 1
+        num_nodes = 0
+        while num_nodes < 2:
+            while i < size and _is_space(data[i]):
+                i += 1
+            if i == size or _is_line_end(data[i]):
+                break
+            negative = data[i] == c'-'
+            if negative or data[i] == c'+':
+                i += 1
+            # Accumulate the absolute value as unsigned and check for overflow before each digit.
+            # The magnitude of negative labels may exceed the largest positive label by one.
+            limit = <unsigned long>LONG_MAX + negative
+            value = 0
+            start = i
+            while i < size and c'0' <= data[i] <= c'9':
+                digit = data[i] - c'0'
+                if value > (limit - digit) // 10:
+                    raise ValueError(f"invalid node label on line {line_number[0]}")
+                value = 10 * value + digit
+                i += 1
+            if i == start or (i < size and not (_is_space(data[i]) or _is_line_end(data[i]))):
+                raise ValueError(f"invalid node label on line {line_number[0]}")
+            # Negate without overflowing for the smallest representable label.
+            nodes[num_nodes] = -<node_t>(value - 1) - 1 if negative and value else <node_t>value
+            num_nodes += 1
+
+        if num_nodes == 1:
+            raise ValueError(f"expected a pair of nodes on line {line_number[0]}")
+        elif num_nodes == 2:
+            num_added += graph._add_directed_edge(nodes[0], nodes[1])
+            graph._add_directed_edge(nodes[1], nodes[0])
+
+        # Skip the remainder of the line, e.g., edge data or comments.
+        while i < size and data[i] != c'\n':
+            i += 1
+        i += 1
+    return num_added
+
+
+def read_edgelist(path, chunk_size: int = 1 << 16, graph: Graph = None) -> Graph:
+    """
+    Read a graph from a text file with one whitespace-separated pair of nodes per line. See
+    :func:`networkx.readwrite.edgelist.read_edgelist` for details.
+
+    Args:
+        path: Path of the file to read or file-like object opened in binary mode. Files whose name
+            ends with `.gz` are decompressed.
+        chunk_size: Number of bytes to read at a time.
+        graph: Graph to add edges to; defaults to an empty graph.
+
+    Returns:
+        graph: Graph with edges read from the file.
+
+    Raises:
+        ValueError: If a line does not start with a pair of integer node labels.
+
+    Note:
+        Text following the pair of nodes on each line (such as edge data written by
+        :func:`networkx.readwrite.edgelist.write_edgelist`) is ignored, and so is any text following
+        a `#` character. Lines are parsed in chunks without creating intermediate python objects.
+    """
+    cdef bytearray buffer
+    cdef char* data
+    cdef Py_ssize_t offset = 0, size, end
+    cdef count_t line_number = 0
+    assert_interval("chunk_size", chunk_size, 1, None)
+    buffer = bytearray(chunk_size)
+    if graph is None:
+        graph = Graph()
+
+    with _open(path, "rb") as fp:
+        while True:
+            num_read = fp.readinto(memoryview(buffer)[offset:])
+            data = buffer
+            # Parse the final line which may not be terminated by a newline character.
+            if not num_read:
+                _parse_text_edges(graph, data, offset, &line_number)
+                break
+
+            # Parse all complete lines and carry the trailing partial line over to the next chunk.
+            size = offset + num_read
+            end = size
+            while end > 0 and data[end - 1] != c'\n':
+                end -= 1
+            _parse_text_edges(graph, data, end, &line_number)
+            offset = size - end
+            memmove(data, data + end, offset)
+
+            # Grow the buffer if a single line does not fit.
+            if offset == len(buffer):
+                buffer.extend(bytearray(len(buffer)))
+    return graph
+
+
+cdef Py_ssize_t _format_node(char* out, node_t node):
+    """
+    Write the decimal representation of a node to `out` and return the number of characters.
+    """
+    cdef char digits[24]
+    cdef Py_ssize_t num_digits = 0, length = 0
+    # Negate as unsigned to avoid overflow for the smallest representable node label.
+    cdef unsigned long value = node
+    if node < 0:
+        out[0] = c'-'
+        length = 1
+        value = -value
+    while True:
+        digits[num_digits] = c'0' + value % 10
+        num_digits += 1
+        value //= 10
+        if not value:
+            break
+    while num_digits:
+        num_digits -= 1
+        out[length] = digits[num_digits]
+        length += 1
+    return length
+
+
+def write_edgelist(graph: Graph, path, chunk_size: int = 1 << 16) -> None:
+    """
+    Write a graph to a text file with one space-separated pair of nodes per line. See
+    :func:`networkx.readwrite.edgelist.write_edgelist` for details.
+
+    Args:
+        graph: Graph to write.
+        path: Path of the file to write or file-like object opened in binary mode. Files whose
+            name ends with `.gz` are compressed.
+        chunk_size: Number of bytes to buffer before writing to the file.
+
+    Note:
+        Isolated nodes are not written, and edges are written in arbitrary order.
+    """
+    cdef bytearray buffer
+    cdef char* data
+    cdef Py_ssize_t offset = 0
+    cdef node_t node
+    assert_interval("chunk_size", chunk_size, 1, None)
+    buffer = bytearray(chunk_size + MAX_LINE_LENGTH)
+    data = buffer
+
+    with _open(path, "wb") as fp:
+        for pair in graph._adjacency_map:
+            node = pair.first
+            for neighbor in pair.second:
+                if node > neighbor:
+                    continue
+                offset += _format_node(data + offset, node)
+                data[offset] = c' '
+                offset += 1
+                offset += _format_node(data + offset, neighbor)
+                data[offset] = c'\n'
+                offset += 1
+                if offset >= chunk_size:
+                    fp.write(memoryview(buffer)[:offset])
+                    offset = 0
+        fp.write(memoryview(buffer)[:offset])
+
+
+def read_binary_edgelist(path, chunk_size: int = 1 << 16, graph: Graph = None) -> Graph:
+    """
+    Read a graph from a binary file of node pairs encoded as 64-bit signed integers in native byte
+    order, e.g., as written by :func:`write_binary_edgelist` or :meth:`numpy.ndarray.tofile`.
+
+    Args:
+        path: Path of the file to read or file-like object opened in binary mode. Files whose name
+            ends with `.gz` are decompressed.
+        chunk_size: Number of bytes to read at a time.
+        graph: Graph to add edges to; defaults to an empty graph.
+
+    Returns:
+        graph: Graph with edges read from the file.
+
+    Raises:
+        ValueError: If the file is truncated, i.e., its size is not a multiple of 16 bytes.
+    """
+    cdef Py_ssize_t pair_size = 2 * sizeof(int64_t)
+    cdef bytearray buffer
+    cdef char* data
+    cdef const int64_t* edges
+    cdef Py_ssize_t offset = 0, size, num_edges, i
+    assert_interval("chunk_size", chunk_size, 1, None)
+    # Reserve space for a partial pair carried over from the previous chunk.
+    buffer = bytearray(chunk_size + pair_size)
+    data = buffer
+    if graph is None:
+        graph = Graph()
+
+    with _open(path, "rb") as fp:
+        while True:
+            num_read = fp.readinto(memoryview(buffer)[offset:])
+            if not num_read:
+                if offset:
+                    raise ValueError(f"file is truncated with {offset} trailing bytes")
+                break
+
+            size = offset + num_read
+            num_edges = size // pair_size
+            edges = <const int64_t*>data
+            for i in range(num_edges):
+                graph._add_directed_edge(edges[2 * i], edges[2 * i + 1])
+                graph._add_directed_edge(edges[2 * i + 1], edges[2 * i])
+            offset = size - num_edges * pair_size
+            memmove(data, data + num_edges * pair_size, offset)
+    return graph
+
+
+def write_binary_edgelist(graph: Graph, path, chunk_size: int = 1 << 16) -> None:
+    """
+    Write a graph to a binary file of node pairs encoded as 64-bit signed integers in native byte
+    order. The file can be read using :func:`read_binary_edgelist` or :func:`numpy.fromfile`.
+
+    Args:
+        graph: Graph to write.
+        path: Path of the file to write or file-like object opened in binary mode. Files whose
+            name ends with `.gz` are compressed.
+        chunk_size: Number of bytes to buffer before writing to the file.
+
+    Note:
+        Isolated nodes are not written, and edges are written in arbitrary order.
+    """
+    cdef Py_ssize_t pair_size = 2 * sizeof(int64_t)
+    cdef bytearray buffer
+    cdef int64_t* edges
+    cdef Py_ssize_t num_edges = 0
+    cdef node_t node
+    assert_interval("chunk_size", chunk_size, 1, None)
+    buffer = bytearray(chunk_size + pair_size)
+    edges = <int64_t*><char*>buffer
+
+    with _open(path, "wb") as fp:
+        for pair in graph._adjacency_map:
+            node = pair.first
+            for neighbor in pair.second:
+                if node > neighbor:
+                    continue
+                edges[2 * num_edges] = node
+                edges[2 * num_edges + 1] = neighbor
+                num_edges += 1
+                if num_edges * pair_size >= chunk_size:
+                    fp.write(memoryview(buffer)[:num_edges * pair_size])
+                    num_edges = 0
+        fp.write(memoryview(buffer)[:num_edges * pair_size])
@@ -0,0 +1,18 @@
+from libcpp.utility cimport pair as pair_t
+from libcpp.vector cimport vector as vector_t
+from .generators.util cimport RandomEngine
+from .graph cimport count_t, edge_list_t, edge_t, Graph
+
+
+cdef class EdgeSwapper:
+    cdef Graph graph
+    cdef RandomEngine random_engine
+    cdef edge_list_t edges
+    cdef vector_t[pair_t[count_t, edge_t]] log
+
+    cpdef int swap(self) except -1
+    cpdef int commit(self)
+    cpdef int rollback(self)
+
+
+cpdef bint is_connected(Graph graph)
@@ -0,0 +1,190 @@
+from cython.operator cimport dereference
+from libcpp.unordered_set cimport unordered_set as unordered_set_t
+from .generators.util cimport get_random_engine
+from .graph cimport node_list_t, node_t
+from .libcpp.random cimport bernoulli_distribution, uniform_int_distribution
+from .util import assert_interval
+
+
+IF DEBUG_LOGGING:
+    import logging
+    LOGGER = logging.getLogger()
+
+
+cdef class EdgeSwapper:
+    """
+    Degree-preserving rewiring of a graph by swapping pairs of edges. Edges are stored in an array
+    so they can be sampled uniformly at random in constant time.
+
+    Args:
+        graph: Graph to rewire in-place. The graph must not be modified by other means while the
+            swapper is in use because the edge index would become inconsistent.
+        random_engine: See :func:`get_random_engine`.
+
+    Each swap is recorded in an undo log until :meth:`commit` is called. Calling :meth:`rollback`
+    reverts uncommitted swaps so proposals can be rejected, e.g., in Metropolis-Hastings samplers.
+    """
+    def __init__(self, graph: Graph, random_engine=None):
+        cdef node_t node
+        self.graph = graph
+        self.random_engine = get_random_engine(random_engine)
+        for pair in graph._adjacency_map:
+            node = pair.first
+            for neighbor in pair.second:
+                if node < neighbor:
+                    self.edges.push_back(edge_t(node, neighbor))
+        if self.edges.size() < 2:
+            raise ValueError("graph must have at least two edges for swapping")
+
+    cpdef int swap(self) except -1:
+        """
+        Attempt to swap a random pair of edges `(u, v)` and `(x, y)` for `(u, x)` and `(v, y)`.
+
+        Returns:
+            swapped: `True` if the edges were swapped, `False` if the swap was rejected because it
+                would have created a self loop or an edge that already exists.
+        """
+        cdef uniform_int_distribution[count_t] edge_dist = \
+            uniform_int_distribution[count_t](0, self.edges.size() - 1)
+        cdef bernoulli_distribution orientation_dist = bernoulli_distribution(0.5)
+        cdef count_t i = edge_dist(self.random_engine.instance)
+        cdef count_t j = edge_dist(self.random_engine.instance)
+        cdef node_t u = self.edges[i].first, v = self.edges[i].second
+        cdef node_t x = self.edges[j].first, y = self.edges[j].second
+        # Choose a random orientation so both possible swaps are proposed.
+        if orientation_dist(self.random_engine.instance):
+            x, y = y, x
+
+        # Reject the swap if the edges share a node or the new edges already exist.
+        if u == x or u == y or v == x or v == y or self.graph.has_edge(u, x) \
+                or self.graph.has_edge(v, y):
+            return False
+
+        self.graph._remove_edge(u, v)
+        self.graph._remove_edge(x, y)
+        self.graph.add_edge(u, x)
+        self.graph.add_edge(v, y)
+        self.log.push_back(pair_t[count_t, edge_t](i, self.edges[i]))
+        self.log.push_back(pair_t[count_t, edge_t](j, self.edges[j]))
+        self.edges[i] = edge_t(u, x)
+        self.edges[j] = edge_t(v, y)
+        IF DEBUG_LOGGING:
+            LOGGER.debug("swapped edges %s and %s for %s and %s", (u, v), (x, y), (u, x), (v, y))
+        return True
+
+    cpdef int commit(self):
+        """
+        Clear the undo log so swaps can no longer be rolled back.
+
+        Returns:
+            num_committed: Number of committed swaps.
+        """
+        cdef count_t num_committed = self.log.size() // 2
+        self.log.clear()
+        return num_committed
+
+    cpdef int rollback(self):
+        """
+        Revert all swaps since the last call to :meth:`commit` in reverse order.
+
+        Returns:
+            num_reverted: Number of reverted swaps.
+        """
+        cdef count_t num_reverted = self.log.size() // 2
+        cdef edge_t edge
+        while not self.log.empty():
+            entry = self.log.back()
+            edge = self.edges[entry.first]
+            self.graph._remove_edge(edge.first, edge.second)
+            self.graph.add_edge(entry.second.first, entry.second.second)
+            self.edges[entry.first] = entry.second
+            self.log.pop_back()
+        return num_reverted
+
+
+cpdef bint is_connected(Graph graph):
+    """
+    Return whether a graph is connected using breadth-first search.
+
+    Args:
+        graph: Graph to check.
+
+    Returns:
+        connected: `True` if all nodes are reachable from any node, `False` otherwise.
+    """
+    cdef unordered_set_t[node_t] visited
+    cdef node_list_t queue
+    cdef count_t i = 0
+    if graph.number_of_nodes() == 0:
+        return True
+
+    queue.push_back(dereference(graph._adjacency_map.begin()).first)
+    visited.insert(queue[0])
+    while i < queue.size():
+        for neighbor in graph._adjacency_map[queue[i]]:
+            if visited.insert(neighbor).second:
+                queue.push_back(neighbor)
+        i += 1
+    return queue.size() == graph.number_of_nodes()
+
+
+def double_edge_swap(graph: Graph, nswap: count_t = 1, random_engine=None, connected: bool = False,
+                     max_tries: int = None) -> Graph:
+    """
+    Swap pairs of edges while preserving the degree of each node. See
+    :func:`networkx.algorithms.swap.double_edge_swap` and
+    :func:`networkx.algorithms.swap.connected_double_edge_swap` for details.
+
+    Args:
+        graph: Graph to rewire in-place.
+        nswap: Number of successful swaps.
+        random_engine: See :func:`get_random_engine`.
+        connected: Whether to ensure the graph remains connected.
+        max_tries: Maximum number of attempted swaps; defaults to `100 * nswap`.
+
+    Returns:
+        graph: Rewired input graph.
+
+    Raises:
+        ValueError: If `nswap` or `max_tries` is negative, if the graph has fewer than two edges, or
+            if `connected` is `True` and the graph is not connected.
+        RuntimeError: If the number of successful swaps is smaller than `nswap` after `max_tries`
+            attempts. Swaps performed up to that point are retained.
+
+    Note:
+        Edges are sampled uniformly at random, and both orientations of the second edge are
+        proposed with equal probability. If `connected` is `True`, swaps are applied in windows and
+        the connectivity of the graph is checked after each window. The window grows by one after a
+        successful window and is halved after a window that disconnects the graph, in which case
+        the swaps of the window are rolled back.
+    """
+    cdef EdgeSwapper swapper
+    cdef count_t num_swaps = 0, num_tries = 0, num_pending, window = 1, tries_limit
+    assert_interval("nswap", nswap, 0, None)
+    if max_tries is not None:
+        assert_interval("max_tries", max_tries, 0, None)
+    tries_limit = 100 * nswap if max_tries is None else max_tries
+    if connected and not is_connected(graph):
+        raise ValueError("graph is not connected")
+    swapper = EdgeSwapper(graph, random_engine)
+
+    while num_swaps < nswap:
+        num_pending = 0
+        while num_pending < min(window, nswap - num_swaps):
+            if num_tries >= tries_limit:
+                if connected:
+                    swapper.rollback()
+                raise RuntimeError(f"exceeded maximum number of tries ({tries_limit}) after "
+                                   f"{num_swaps} successful swaps")
+            num_tries += 1
+            num_pending += swapper.swap()
+
+        if not connected:
+            num_swaps += swapper.commit()
+        elif is_connected(graph):
+            num_swaps += swapper.commit()
+            window += 1
+        else:
+            swapper.rollback()
+            window = max(window // 2, 1)
+    return graph
@@ -2,3 +2,4 @@
 
 from cygraph cimport graph
 from cygraph.graph cimport Graph
+from cygraph cimport hashing, rewiring
@@ -1,9 +1,11 @@
 import cygraph
+import cygraph.generators
 import functools as ft
 import itertools as it
 import logging
 import networkx as nx
 import numbers
+import numpy as np
 import pytest
 import random
 import typing
@@ -317,3 +319,47 @@ def test_assert_normalized_node_labels(graph: cygraph.Graph, failing: bool):
             cygraph.graph.assert_normalized_node_labels(graph)
     else:
         assert cygraph.graph.assert_normalized_node_labels(graph) is graph
+
+
+def test_batch_queries():
+    graph = cygraph.generators.duplication_mutation_graph(100, 0.5, 0.5, random_engine=1)
+    pairs = np.random.randint(0, 100, (1000, 2))
+    exists = graph.has_edges(pairs)
+    assert exists.dtype == bool
+    np.testing.assert_array_equal(exists, [graph.has_edge(u, v) for u, v in pairs.tolist()])
+
+    nodes = np.random.permutation(100)[:50]
+    degrees = graph.degrees(nodes)
+    np.testing.assert_array_equal(degrees, [graph.degree[node] for node in nodes.tolist()])
+
+    indptr, indices = graph.neighbors_many(nodes)
+    np.testing.assert_array_equal(np.diff(indptr), degrees)
+    for i, node in enumerate(nodes.tolist()):
+        assert set(indices[indptr[i]:indptr[i + 1]].tolist()) == graph.neighbors(node)
+
+
+def test_batch_queries_empty():
+    graph = cygraph.Graph(None, [(0, 1)])
+    assert graph.has_edges([]).shape == (0,)
+    assert graph.degrees([]).shape == (0,)
+    indptr, indices = graph.neighbors_many([])
+    np.testing.assert_array_equal(indptr, [0])
+    assert indices.shape == (0,)
+
+
+def test_batch_queries_invalid():
+    graph = cygraph.Graph(None, [(0, 1)])
+    with pytest.raises(ValueError):
+        graph.has_edges([0, 1, 2])
+    with pytest.raises(ValueError):
+        graph.has_edges(np.zeros((5, 0), dtype=int))
+    with pytest.raises(ValueError):
+        graph.has_edges(np.zeros((0, 3), dtype=int))
+    with pytest.raises(ValueError):
+        graph.degrees([[0, 1], [1, 0]])
+    with pytest.raises(ValueError):
+        graph.neighbors_many([[0, 1], [1, 0]])
+    with pytest.raises(KeyError):
+        graph.degrees([0, 7])
+    with pytest.raises(KeyError):
+        graph.neighbors_many([0, 7])
@@ -0,0 +1,70 @@
+import cygraph
+from cygraph import generators, hashing
+import itertools as it
+import networkx as nx
+import pytest
+import random
+
+
+def relabel_randomly(graph: cygraph.Graph) -> cygraph.Graph:
+    nodes = list(graph)
+    mapping = dict(zip(nodes, random.sample(range(10 * len(nodes)), len(nodes))))
+    return cygraph.Graph([mapping[node] for node in nodes],
+                         [(mapping[u], mapping[v]) for u, v in graph.edges])
+
+
+@pytest.fixture
+def graphs():
+    return [cygraph.Graph(), cygraph.Graph({0})] + [
+        generators.duplication_mutation_graph(n, 0.5, 0.5, random_engine=seed)
+        for n, seed in it.product([10, 20], [0, 1, 2])
+    ]
+
+
+@pytest.mark.parametrize("iterations", [0, 1, 3])
+def test_weisfeiler_lehman_graph_hash_isomorphic(graphs, iterations: int):
+    for graph in graphs:
+        assert hashing.weisfeiler_lehman_graph_hash(graph, iterations) == \
+            hashing.weisfeiler_lehman_graph_hash(relabel_randomly(graph), iterations)
+
+
+def test_weisfeiler_lehman_graph_hash_consistent_with_networkx(graphs):
+    for graph1, graph2 in it.combinations(graphs, 2):
+        expected = nx.weisfeiler_lehman_graph_hash(graph1) == \
+            nx.weisfeiler_lehman_graph_hash(graph2)
+        actual = hashing.weisfeiler_lehman_graph_hash(graph1) == \
+            hashing.weisfeiler_lehman_graph_hash(graph2)
+        assert expected == actual
+
+
+def test_weisfeiler_lehman_graph_hash_distinguishes():
+    cycle = cygraph.Graph(None, [(i, (i + 1) % 6) for i in range(6)])
+    triangles = cygraph.Graph(None, [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3)])
+    star = cygraph.Graph(None, [(0, i) for i in range(1, 4)])
+    path = cygraph.Graph(None, [(0, 1), (1, 2), (2, 3)])
+    assert hashing.weisfeiler_lehman_graph_hash(star) != hashing.weisfeiler_lehman_graph_hash(path)
+    # Both graphs are 2-regular and indistinguishable by the Weisfeiler-Lehman test.
+    assert hashing.weisfeiler_lehman_graph_hash(cycle) == \
+        hashing.weisfeiler_lehman_graph_hash(triangles)
+
+
+@pytest.mark.parametrize("iterations", [0, 1, 3])
+def test_weisfeiler_lehman_node_labels(iterations: int):
+    graph = generators.duplication_mutation_graph(30, 0.5, 0.5, random_engine=3)
+    labels = hashing.weisfeiler_lehman_node_labels(graph, iterations)
+    assert set(labels) == set(graph)
+
+    # Nodes with the same label should have the same networkx subgraph hashes.
+    expected = nx.weisfeiler_lehman_subgraph_hashes(graph, iterations=max(iterations, 1))
+    for u, v in it.combinations(graph, 2):
+        if iterations == 0:
+            assert (labels[u] == labels[v]) == (graph.degree[u] == graph.degree[v])
+        else:
+            assert (labels[u] == labels[v]) == (expected[u][-1] == expected[v][-1])
+
+
+def test_weisfeiler_lehman_invalid_iterations():
+    with pytest.raises(ValueError):
+        hashing.weisfeiler_lehman_graph_hash(cygraph.Graph(), -1)
+    with pytest.raises(ValueError):
+        hashing.weisfeiler_lehman_node_labels(cygraph.Graph(), -1)
@@ -0,0 +1,112 @@
+import cygraph
+from cygraph import generators, io
+import io as io_
+import networkx as nx
+import numpy as np
+import pathlib
+import pytest
+
+
+@pytest.fixture
+def graph():
+    graph = generators.duplication_mutation_graph(500, 0.5, 0.5, random_engine=3)
+    # Add edges with negative and large node labels.
+    graph.add_edge(-7, 2 ** 62)
+    graph.add_edge(-2 ** 63, 0)
+    return graph
+
+
+def assert_same_edges(graph1, graph2):
+    assert set(map(frozenset, graph1.edges)) == set(map(frozenset, graph2.edges))
+
+
+@pytest.mark.parametrize("filename", ["graph.txt", "graph.txt.gz"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_edgelist_roundtrip(graph: cygraph.Graph, tmp_path: pathlib.Path, filename: str,
+                            chunk_size: int):
+    path = tmp_path / filename
+    io.write_edgelist(graph, path, chunk_size=chunk_size)
+    assert_same_edges(graph, io.read_edgelist(path, chunk_size=chunk_size))
+    assert_same_edges(graph, nx.read_edgelist(path, nodetype=int))
+
+
+@pytest.mark.parametrize("filename", ["graph.bin", "graph.bin.gz"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_binary_edgelist_roundtrip(graph: cygraph.Graph, tmp_path: pathlib.Path, filename: str,
+                                   chunk_size: int):
+    path = tmp_path / filename
+    io.write_binary_edgelist(graph, path, chunk_size=chunk_size)
+    assert_same_edges(graph, io.read_binary_edgelist(path, chunk_size=chunk_size))
+
+
+def test_binary_edgelist_numpy(graph: cygraph.Graph, tmp_path: pathlib.Path):
+    path = tmp_path / "graph.bin"
+    io.write_binary_edgelist(graph, path)
+    edges = np.fromfile(path, dtype=np.int64).reshape((-1, 2))
+    assert edges.shape == (graph.number_of_edges(), 2)
+    assert_same_edges(graph, cygraph.Graph(None, edges.tolist()))
+
+    edges[::-1].tofile(path)
+    assert_same_edges(graph, io.read_binary_edgelist(path))
+
+
+def test_read_edgelist_networkx(graph: cygraph.Graph, tmp_path: pathlib.Path):
+    # Networkx writes edge data by default.
+    path = tmp_path / "graph.txt"
+    nx.write_edgelist(nx.Graph(list(graph.edges)), path)
+    assert_same_edges(graph, io.read_edgelist(path))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+def test_read_edgelist_format(chunk_size: int):
+    text = b"-9223372036854775808 9223372036854775807\n# comment\n\n 0\t1 \r\n" \
+        b"1 2 # trailing comment\n+3 -4 {'weight': 1}\n   \n5 6#\n7 8"
+    graph = io.read_edgelist(io_.BytesIO(text), chunk_size=chunk_size)
+    assert set(graph) == {-2 ** 63, 2 ** 63 - 1, 0, 1, 2, 3, -4, 5, 6, 7, 8}
+    assert_same_edges(graph, cygraph.Graph(None, [(-2 ** 63, 2 ** 63 - 1), (0, 1), (1, 2), (3, -4),
+                                                  (5, 6), (7, 8)]))
+
+
+@pytest.mark.parametrize("text, match", [
+    (b"0 1\n2\n", "pair of nodes on line 2"),
+    (b"0 1\n2 x\n", "invalid node label on line 2"),
+    (b"0 1a\n", "invalid node label on line 1"),
+    (b"- 1\n", "invalid node label on line 1"),
+    (b"0 1\n99999999999999999999 1\n", "invalid node label on line 2"),
+    (b"9223372036854775808 1\n", "invalid node label on line 1"),
+    (b"-9223372036854775809 1\n", "invalid node label on line 1"),
+])
+def test_read_edgelist_invalid(text: bytes, match: str):
+    with pytest.raises(ValueError, match=match):
+        io.read_edgelist(io_.BytesIO(text))
+
+
+def test_read_into_graph():
+    graph = cygraph.Graph({17})
+    assert io.read_edgelist(io_.BytesIO(b"0 1\n"), graph=graph) is graph
+    assert io.read_binary_edgelist(io_.BytesIO(np.array([3, 4]).tobytes()), graph=graph) is graph
+    assert set(graph) == {0, 1, 3, 4, 17}
+
+
+def test_read_binary_edgelist_truncated():
+    with pytest.raises(ValueError, match="truncated"):
+        io.read_binary_edgelist(io_.BytesIO(np.arange(3).tobytes()))
+
+
+def test_write_file_object(graph: cygraph.Graph):
+    with io_.BytesIO() as fp:
+        io.write_edgelist(graph, fp)
+        fp.seek(0)
+        assert_same_edges(graph, io.read_edgelist(fp))
+
+
+@pytest.mark.parametrize("func", [io.read_edgelist, io.read_binary_edgelist])
+def test_read_invalid_chunk_size(func):
+    with pytest.raises(ValueError):
+        func(io_.BytesIO(), chunk_size=0)
+
+
+@pytest.mark.parametrize("func", [io.write_edgelist, io.write_binary_edgelist])
+def test_write_invalid_chunk_size(func):
+    with pytest.raises(ValueError):
+        func(cygraph.Graph(), io_.BytesIO(), chunk_size=0)
@@ -0,0 +1,96 @@
+import cygraph
+from cygraph import generators, rewiring
+import logging
+import networkx as nx
+import pytest
+
+
+@pytest.fixture
+def graph():
+    return generators.duplication_mutation_graph(200, 0.5, 0.5, random_engine=7,
+                                                 drop_isolates=True)
+
+
+def sorted_edges(graph):
+    return sorted((min(u, v), max(u, v)) for u, v in graph.edges)
+
+
+@pytest.mark.parametrize("connected", [False, True])
+def test_double_edge_swap(graph: cygraph.Graph, connected: bool):
+    degrees = dict(graph.degree)
+    edges = sorted_edges(graph)
+    assert rewiring.double_edge_swap(graph, 500, random_engine=3, connected=connected) is graph
+    assert dict(graph.degree) == degrees
+    assert sorted_edges(graph) != edges
+    assert nx.number_of_selfloops(graph) == 0
+    if connected:
+        assert nx.is_connected(graph)
+
+
+def test_double_edge_swap_connected_tree():
+    # Most swaps disconnect a path, so this exercises rolling back windows.
+    graph = cygraph.Graph(None, [(i, i + 1) for i in range(50)])
+    rewiring.double_edge_swap(graph, 20, random_engine=5, connected=True)
+    assert nx.is_connected(graph)
+    assert graph.number_of_edges() == 50
+
+
+@pytest.mark.parametrize("connected", [False, True])
+def test_double_edge_swap_max_tries(connected: bool):
+    # No swaps are possible in a complete graph because all edges already exist.
+    graph = cygraph.Graph(None, [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)])
+    edges = sorted_edges(graph)
+    with pytest.raises(RuntimeError, match="maximum number of tries"):
+        rewiring.double_edge_swap(graph, 1, connected=connected)
+    assert sorted_edges(graph) == edges
+
+
+def test_double_edge_swap_invalid():
+    with pytest.raises(ValueError, match="at least two edges"):
+        rewiring.double_edge_swap(cygraph.Graph(None, [(0, 1)]))
+    with pytest.raises(ValueError, match="not connected"):
+        rewiring.double_edge_swap(cygraph.Graph(None, [(0, 1), (2, 3)]), connected=True)
+    with pytest.raises(ValueError):
+        rewiring.double_edge_swap(cygraph.Graph(None, [(0, 1), (2, 3)]), -1)
+    # No swaps are possible in a complete graph so an invalid limit would never terminate.
+    complete = cygraph.Graph(None, [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)])
+    with pytest.raises(ValueError, match="max_tries"):
+        rewiring.double_edge_swap(complete, 1, max_tries=-1)
+
+
+def test_edge_swapper_commit_rollback(graph: cygraph.Graph):
+    swapper = rewiring.EdgeSwapper(graph, 11)
+    num_swaps = sum(swapper.swap() for _ in range(100))
+    assert num_swaps > 0
+    assert swapper.commit() == num_swaps
+    assert swapper.rollback() == 0
+    committed = sorted_edges(graph)
+
+    num_swaps = sum(swapper.swap() for _ in range(100))
+    assert sorted_edges(graph) != committed
+    assert swapper.rollback() == num_swaps
+    assert sorted_edges(graph) == committed
+
+    # The edge index must remain consistent with the graph after rolling back.
+    for _ in range(100):
+        swapper.swap()
+        swapper.commit()
+    assert graph.number_of_edges() == len(committed)
+
+
+@pytest.mark.parametrize("graph, connected", [
+    (cygraph.Graph(), True),
+    (cygraph.Graph({0}), True),
+    (cygraph.Graph({0, 1}), False),
+    (cygraph.Graph(None, [(0, 1), (1, 2)]), True),
+    (cygraph.Graph(None, [(0, 1), (2, 3)]), False),
+])
+def test_is_connected(graph: cygraph.Graph, connected: bool):
+    assert rewiring.is_connected(graph) == connected
+
+
+@pytest.mark.skipif(not cygraph.DEBUG_LOGGING, reason="debug logging not enabled")
+def test_debug_logging_swap(graph: cygraph.Graph, caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.DEBUG):
+        rewiring.double_edge_swap(graph, 1)
+    assert "swapped edges" in caplog.text